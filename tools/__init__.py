@@ -0,0 +1 @@
+"""RSSB content tools: scraper, R2 uploader and the rssb-tools CLI."""
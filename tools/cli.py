@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+RSSB Tools CLI
+Single entry point for the scrape, upload, sync and status commands.
+"""
+
+import argparse
+import sys
+
+# Only the lightweight command modules are imported here; each one defers its
+# heavy dependencies (requests, bs4, boto3, ...) to the code paths that need
+# them, so `--help`, `status` and dry runs start quickly.
+try:
+    from . import manager, scraper, status, uploader
+except ImportError:
+    # Run as a plain script (`python tools/cli.py`)
+    import manager
+    import scraper
+    import status
+    import uploader
+
+COMMANDS = (
+    ("scrape", scraper, "Download audio content and generate catalogs"),
+    ("upload", uploader, "Sync downloaded content to R2"),
+    ("sync", manager, "Scrape and then upload in one run"),
+    ("status", status, "Summarise the local downloads directory"),
+)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="rssb-tools", description="RSSB content tools")
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    for name, module, help_text in COMMANDS:
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        module.add_arguments(subparser)
+        subparser.set_defaults(func=module.run)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
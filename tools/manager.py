@@ -4,13 +4,16 @@ RSSB Content Manager
 Orchestrates scraping and uploading of content.
 """
 
-import os
 import argparse
-import subprocess
-import sys
 
-def setup_args():
-    parser = argparse.ArgumentParser(description="RSSB Content Manager")
+try:
+    from . import scraper, uploader
+except ImportError:
+    # Run as a plain script (`python tools/manager.py`)
+    import scraper
+    import uploader
+
+def add_arguments(parser):
     parser.add_argument("--limit", type=int, default=0, help="Limit number of items per category for scraper")
     parser.add_argument("--max-size", type=int, default=0, help="Max file size for scraper (verification)")
     parser.add_argument("--bucket", default="rssb-stream", help="R2 Bucket name")
@@ -18,25 +21,19 @@ def setup_args():
     parser.add_argument("--only-scrape", action="store_true", help="Run only the scraper")
     parser.add_argument("--only-upload", action="store_true", help="Run only the uploader")
     parser.add_argument("--no-ssl-verify", action="store_true", help="Disable SSL verification for uploader")
-    return parser.parse_args()
-
-def run_script(script_name, args):
-    """Run a python script with arguments."""
-    cmd = [sys.executable, script_name] + args
-    print(f"\n>>> Running {script_name} with args: {args}")
-    try:
-        subprocess.check_call(cmd)
-    except subprocess.CalledProcessError as e:
-        print(f"Error running {script_name}: {e}")
-        sys.exit(1)
+    return parser
 
-def main():
-    args = setup_args()
+def setup_args(argv=None):
+    parser = argparse.ArgumentParser(description="RSSB Content Manager")
+    return add_arguments(parser).parse_args(argv)
 
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    scraper_script = os.path.join(base_dir, "scraper.py")
-    uploader_script = os.path.join(base_dir, "uploader.py")
+def run_stage(module, args):
+    """Run a stage's entry point in this process with CLI-style arguments."""
+    name = module.__name__.rsplit(".", 1)[-1]
+    print(f"\n>>> Running {name} with args: {args}")
+    module.main(args)
 
+def run(args):
     # 1. Scraper
     if not args.only_upload:
         scraper_args = []
@@ -47,7 +44,7 @@ def main():
         if args.dry_run:
             scraper_args.append("--dry-run")
 
-        run_script(scraper_script, scraper_args)
+        run_stage(scraper, scraper_args)
 
     # 2. Uploader
     if not args.only_scrape:
@@ -65,9 +62,12 @@ def main():
         if args.no_ssl_verify:
             uploader_args.append("--no-ssl-verify")
 
-        run_script(uploader_script, uploader_args)
+        run_stage(uploader, uploader_args)
 
     print("\n>>> All tasks completed.")
 
+def main(argv=None):
+    return run(setup_args(argv))
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,15 @@
+"""
+Progress output helpers shared by the scraper and uploader.
+tqdm is imported on first use so that commands which never draw a progress
+bar (`--help`, `status`) do not pay for it.
+"""
+
+def bar(*args, **kwargs):
+    """Create a tqdm progress bar."""
+    from tqdm import tqdm
+    return tqdm(*args, **kwargs)
+
+def write(message):
+    """Print a message without breaking any active progress bars."""
+    from tqdm import tqdm
+    tqdm.write(message)
@@ -6,14 +6,20 @@ Downloads audio content and generates catalog JSON files.
 
 import os
 import json
-import requests
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, quote, unquote
 import time
 import argparse
 import sys
-from tqdm import tqdm
+
+try:
+    from . import progress
+except ImportError:
+    # Run as a plain script (`python tools/scraper.py`)
+    import progress
+
+# requests and bs4 are imported inside the functions that use them so that
+# `--help` and the other CLI subcommands start without paying for them.
 
 BASE_URL = "https://rssb.org"
 OUTPUT_DIR = "./downloads"
@@ -57,23 +63,28 @@ class ScraperStats:
 
 stats = ScraperStats()
 
-def setup_args():
-    parser = argparse.ArgumentParser(description="Scrape RSSB audio content")
+def add_arguments(parser):
     parser.add_argument("--limit", type=int, default=0, help="Limit number of items per category (0 for all)")
     parser.add_argument("--dry-run", action="store_true", help="Do not download files, just generate catalogs")
     # Add a max-size option for verification to avoid filling up disk
     parser.add_argument("--max-size", type=int, default=0, help="Max file size to download in bytes (0 for unlimited). Useful for verification.")
-    return parser.parse_args()
+    return parser
+
+def setup_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape RSSB audio content")
+    return add_arguments(parser).parse_args(argv)
 
 def download_file(url, output_path, dry_run=False, max_size=0):
     """Download a file with progress and retries."""
     stats.total += 1
 
     if dry_run:
-        tqdm.write(f"  [Dry Run] Would download: {url} -> {output_path}")
+        progress.write(f"  [Dry Run] Would download: {url} -> {output_path}")
         stats.downloaded += 1 # Count as downloaded in dry run
         return
 
+    import requests
+
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
     if os.path.exists(output_path):
@@ -90,7 +101,7 @@ def download_file(url, output_path, dry_run=False, max_size=0):
             resp.raise_for_status()
             total_size = int(resp.headers.get('content-length', 0))
 
-            with open(temp_path, 'wb') as f, tqdm(
+            with open(temp_path, 'wb') as f, progress.bar(
                 desc=os.path.basename(output_path),
                 total=total_size,
                 unit='B',
@@ -114,18 +125,20 @@ def download_file(url, output_path, dry_run=False, max_size=0):
 
         except Exception as e:
             attempt += 1
-            tqdm.write(f"  Error downloading {url} (Attempt {attempt}/{retries}): {e}")
+            progress.write(f"  Error downloading {url} (Attempt {attempt}/{retries}): {e}")
             if os.path.exists(temp_path):
                 os.remove(temp_path)
 
             if attempt < retries:
                 time.sleep(5)
             else:
-                tqdm.write(f"  Failed to download {url} after {retries} attempts.")
+                progress.write(f"  Failed to download {url} after {retries} attempts.")
                 stats.failed += 1
 
 def get_soup(url):
     """Helper to get BeautifulSoup object."""
+    import requests
+    from bs4 import BeautifulSoup
     try:
         resp = requests.get(url, timeout=30)
         resp.raise_for_status()
@@ -133,7 +146,7 @@ def get_soup(url):
         resp.encoding = 'utf-8'
         return BeautifulSoup(resp.text, 'html.parser')
     except Exception as e:
-        tqdm.write(f"Error fetching {url}: {e}")
+        progress.write(f"Error fetching {url}: {e}")
         return None
 
 def scrape_audiobooks(limit, dry_run, max_size):
@@ -157,10 +170,10 @@ def scrape_audiobooks(limit, dry_run, max_size):
     if limit > 0:
         book_links = book_links[:limit]
 
-    tqdm.write(f"Found {len(book_links)} audiobooks to process.")
+    progress.write(f"Found {len(book_links)} audiobooks to process.")
 
     # Use tqdm for the batch progress
-    for title, book_url in tqdm(book_links, desc="Audiobooks", unit="book"):
+    for title, book_url in progress.bar(book_links, desc="Audiobooks", unit="book"):
         book_soup = get_soup(book_url)
         if not book_soup: continue
 
@@ -249,9 +262,9 @@ def scrape_qna(limit, dry_run, max_size):
     if limit > 0:
         links = links[:limit]
 
-    tqdm.write(f"Found {len(links)} Q&A sessions to process.")
+    progress.write(f"Found {len(links)} Q&A sessions to process.")
 
-    for i, link in enumerate(tqdm(links, desc="Q&A Sessions", unit="session")):
+    for i, link in enumerate(progress.bar(links, desc="Q&A Sessions", unit="session")):
         file_rel_path = link['data-url']
         file_url = urljoin(BASE_URL, file_rel_path)
 
@@ -284,9 +297,9 @@ def scrape_shabads(limit, dry_run, max_size):
     if limit > 0:
         mp3_links = mp3_links[:limit]
 
-    tqdm.write(f"Found {len(mp3_links)} shabads to process.")
+    progress.write(f"Found {len(mp3_links)} shabads to process.")
 
-    for link in tqdm(mp3_links, desc="Shabads", unit="track"):
+    for link in progress.bar(mp3_links, desc="Shabads", unit="track"):
         href = link['href']
         file_url = urljoin(BASE_URL, href)
 
@@ -329,9 +342,9 @@ def scrape_discourses(limit, dry_run, max_size):
     if limit > 0:
         links = links[:limit]
 
-    tqdm.write(f"Found {len(links)} discourses to process.")
+    progress.write(f"Found {len(links)} discourses to process.")
 
-    for i, link in enumerate(tqdm(links, desc="Discourses", unit="track")):
+    for i, link in enumerate(progress.bar(links, desc="Discourses", unit="track")):
         file_rel_path = link['data-url']
         file_url = urljoin(BASE_URL, file_rel_path)
 
@@ -364,35 +377,36 @@ def generate_catalog(content, output_file):
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(content, f, indent=2, ensure_ascii=False)
 
-    tqdm.write(f"Generated catalog: {output_file}")
-
-def main():
-    args = setup_args()
+    progress.write(f"Generated catalog: {output_file}")
 
+def run(args):
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     # Audiobooks
-    tqdm.write("\n=== Scraping Audiobooks ===")
+    progress.write("\n=== Scraping Audiobooks ===")
     audiobooks = scrape_audiobooks(args.limit, args.dry_run, args.max_size)
     generate_catalog(audiobooks, f"{OUTPUT_DIR}/catalog/audiobooks.json")
 
     # Q&A
-    tqdm.write("\n=== Scraping Q&A ===")
+    progress.write("\n=== Scraping Q&A ===")
     qna = scrape_qna(args.limit, args.dry_run, args.max_size)
     generate_catalog(qna, f"{OUTPUT_DIR}/catalog/qna.json")
 
     # Shabads
-    tqdm.write("\n=== Scraping Shabads ===")
+    progress.write("\n=== Scraping Shabads ===")
     shabads = scrape_shabads(args.limit, args.dry_run, args.max_size)
     generate_catalog(shabads, f"{OUTPUT_DIR}/catalog/shabads.json")
 
     # Discourses
-    tqdm.write("\n=== Scraping Discourses ===")
+    progress.write("\n=== Scraping Discourses ===")
     discourses = scrape_discourses(args.limit, args.dry_run, args.max_size)
     generate_catalog(discourses, f"{OUTPUT_DIR}/catalog/discourses.json")
 
-    tqdm.write("\n=== Done! ===")
+    progress.write("\n=== Done! ===")
     print(stats)
 
+def main(argv=None):
+    return run(setup_args(argv))
+
 if __name__ == "__main__":
     main()
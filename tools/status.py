@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+RSSB Content Status
+Summarises the local downloads directory without touching the network.
+"""
+
+import os
+import json
+import argparse
+
+def add_arguments(parser):
+    parser.add_argument("--source", default="./downloads", help="Source directory")
+    return parser
+
+def setup_args(argv=None):
+    parser = argparse.ArgumentParser(description="Show local content status")
+    return add_arguments(parser).parse_args(argv)
+
+def format_size(num_bytes):
+    """Format a byte count using binary units."""
+    size = float(num_bytes)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
+
+def audio_summary(source):
+    """Count finished, partial and unreadable downloads per audio category."""
+    summary = {}
+    audio_dir = os.path.join(source, "audio")
+    if not os.path.isdir(audio_dir):
+        return summary
+
+    for category in sorted(os.listdir(audio_dir)):
+        category_dir = os.path.join(audio_dir, category)
+        if not os.path.isdir(category_dir):
+            continue
+
+        files = 0
+        partial = 0
+        unreadable = 0
+        size = 0
+        for root, dirs, names in os.walk(category_dir):
+            for name in names:
+                if name.endswith(".part"):
+                    partial += 1
+                    continue
+                try:
+                    size += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    # Dangling symlink, or removed while we were walking
+                    unreadable += 1
+                    continue
+                files += 1
+
+        summary[category] = {"files": files, "partial": partial, "unreadable": unreadable, "size": size}
+
+    return summary
+
+def catalog_summary(source):
+    """Count entries in each generated catalog, or None if it is unreadable."""
+    summary = {}
+    catalog_dir = os.path.join(source, "catalog")
+    if not os.path.isdir(catalog_dir):
+        return summary
+
+    for name in sorted(os.listdir(catalog_dir)):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(catalog_dir, name), encoding='utf-8') as f:
+                summary[name] = len(json.load(f))
+        except (OSError, ValueError, TypeError):
+            summary[name] = None
+
+    return summary
+
+def run(args):
+    if not os.path.isdir(args.source):
+        print(f"Source directory not found: {args.source}")
+        return 1
+
+    print(f"=== Content Status: {args.source} ===")
+
+    print("Audio:")
+    audio = audio_summary(args.source)
+    if not audio:
+        print("  (none)")
+    for category, info in audio.items():
+        line = f"  {category}: {info['files']} files, {format_size(info['size'])}"
+        notes = [f"{info[key]} {key}" for key in ("partial", "unreadable") if info[key]]
+        if notes:
+            line += f" ({', '.join(notes)})"
+        print(line)
+
+    print("Catalogs:")
+    catalogs = catalog_summary(args.source)
+    if not catalogs:
+        print("  (none)")
+    for name, count in catalogs.items():
+        print(f"  {name}: {'unreadable' if count is None else f'{count} entries'}")
+
+    return 0
+
+def main(argv=None):
+    return run(setup_args(argv))
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for the rssb-tools tests.
+
+Commands are run in a subprocess through the `rssb_tools` package, the same
+way the installed `rssb-tools` console script invokes them.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Equivalent of the `rssb-tools = "rssb_tools.cli:main"` console script
+ENTRY_POINT = "import sys; from rssb_tools.cli import main; sys.exit(main())"
+
+@pytest.fixture(scope="session")
+def package_path(tmp_path_factory):
+    """Directory that exposes tools/ as the `rssb_tools` package."""
+    root = tmp_path_factory.mktemp("site")
+    os.symlink(TOOLS_DIR, root / "rssb_tools", target_is_directory=True)
+    return str(root)
+
+@pytest.fixture
+def run_cli(package_path):
+    """Run `rssb-tools <args>` from `cwd` and return the CompletedProcess."""
+    def run(args, cwd, python_args=()):
+        env = {key: value for key, value in os.environ.items() if not key.startswith("R2_")}
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_path, env.get("PYTHONPATH")]))
+        return subprocess.run(
+            [sys.executable, *python_args, "-c", ENTRY_POINT, *args],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+    return run
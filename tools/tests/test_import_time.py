@@ -0,0 +1,75 @@
+"""
+Startup regression tests for the rssb-tools CLI.
+
+Each command is run under `python -X importtime` through the `rssb_tools`
+package. Only imports made by the package itself count towards the budget;
+interpreter and `site` startup are excluded. Override the budget with
+RSSB_TOOLS_IMPORT_BUDGET_MS on slow machines.
+"""
+
+import os
+
+import pytest
+
+BUDGET_MS = float(os.getenv("RSSB_TOOLS_IMPORT_BUDGET_MS", "50"))
+HEAVY_MODULES = ("requests", "bs4", "boto3", "botocore", "dotenv", "tqdm", "urllib3")
+COMMANDS = [
+    ["--help"],
+    ["scrape", "--help"],
+    ["upload", "--help"],
+    ["sync", "--help"],
+    ["status"],
+]
+
+def parse_importtime(stderr):
+    """Return (name, depth, cumulative us) for each `-X importtime` row."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header row
+        name = name[1:]
+        stripped = name.lstrip()
+        rows.append((stripped, (len(name) - len(stripped)) // 2, int(cumulative)))
+    return rows
+
+def package_import_us(rows):
+    """Cumulative import time from the first `rssb_tools` import onwards.
+
+    Rows are printed when an import finishes, so each top-level row already
+    includes its children and everything before the package's first
+    top-level row belongs to interpreter startup.
+    """
+    top_level = [(name, us) for name, depth, us in rows if depth == 0]
+    for index, (name, _) in enumerate(top_level):
+        if name.split(".")[0] == "rssb_tools":
+            return sum(us for _, us in top_level[index:])
+    raise AssertionError("rssb_tools was never imported")
+
+def import_profile(run_cli, args, tmp_path):
+    (tmp_path / "downloads").mkdir()
+    result = run_cli(args, cwd=tmp_path, python_args=["-X", "importtime"])
+    assert result.returncode == 0, result.stdout + result.stderr
+    return parse_importtime(result.stderr)
+
+@pytest.mark.parametrize("args", COMMANDS)
+def test_startup_within_budget(run_cli, args, tmp_path):
+    rows = import_profile(run_cli, args, tmp_path)
+
+    total_ms = package_import_us(rows) / 1000
+    assert total_ms <= BUDGET_MS, (
+        f"Package import time {total_ms:.1f} ms exceeds budget of {BUDGET_MS:.0f} ms"
+    )
+
+@pytest.mark.parametrize("args", COMMANDS)
+def test_startup_skips_heavy_modules(run_cli, args, tmp_path):
+    # Without the dependencies installed this check could never fail
+    for module in HEAVY_MODULES:
+        pytest.importorskip(module)
+
+    rows = import_profile(run_cli, args, tmp_path)
+
+    heavy = sorted({name for name, _, _ in rows if name.split(".")[0] in HEAVY_MODULES})
+    assert not heavy, f"Heavy modules imported at startup: {heavy}"
@@ -0,0 +1,37 @@
+"""
+Tests for `rssb-tools status`.
+"""
+
+import json
+import os
+
+def test_missing_source(run_cli, tmp_path):
+    result = run_cli(["status", "--source", "missing"], cwd=tmp_path)
+
+    assert result.returncode == 1
+    assert "Source directory not found: missing" in result.stdout
+
+def test_counts_audio_files(run_cli, tmp_path):
+    qna = tmp_path / "downloads" / "audio" / "qna"
+    qna.mkdir(parents=True)
+    (qna / "001.mp3").write_bytes(b"x" * 2048)
+    (qna / "002.mp3.part").write_bytes(b"x" * 512)
+    os.symlink(qna / "gone.mp3", qna / "003.mp3")
+
+    result = run_cli(["status"], cwd=tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert "qna: 1 files, 2.0 KiB (1 partial, 1 unreadable)" in result.stdout
+
+def test_counts_catalog_entries(run_cli, tmp_path):
+    catalog = tmp_path / "downloads" / "catalog"
+    catalog.mkdir(parents=True)
+    (catalog / "qna.json").write_text(json.dumps([{"id": "qna-001"}, {"id": "qna-002"}]))
+    (catalog / "shabads.json").write_text("{not json")
+
+    result = run_cli(["status"], cwd=tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert "Audio:\n  (none)" in result.stdout
+    assert "qna.json: 2 entries" in result.stdout
+    assert "shabads.json: unreadable" in result.stdout
@@ -0,0 +1,23 @@
+"""
+Tests for `rssb-tools upload`.
+"""
+
+import pytest
+
+def test_loads_env_from_working_directory(run_cli, tmp_path):
+    for module in ("boto3", "dotenv", "tqdm"):
+        pytest.importorskip(module)
+
+    (tmp_path / "downloads").mkdir()
+    (tmp_path / ".env").write_text(
+        "R2_ENDPOINT_URL=https://example.r2.cloudflarestorage.com\n"
+        "R2_ACCESS_KEY_ID=test-key\n"
+        "R2_SECRET_ACCESS_KEY=test-secret\n"
+    )
+
+    # An empty source never reaches the network once the client is created
+    result = run_cli(["upload", "--no-dry-run"], cwd=tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert "Missing R2 credentials" not in result.stdout + result.stderr
+    assert "Found 0 files to process." in result.stdout + result.stderr
@@ -7,14 +7,17 @@ Syncs downloaded content to Cloudflare R2 (S3 compatible).
 import os
 import argparse
 import mimetypes
-import boto3
-from botocore.exceptions import NoCredentialsError, ClientError
-from dotenv import load_dotenv
-from tqdm import tqdm
 import threading
 
-# Load environment variables
-load_dotenv()
+try:
+    from . import progress
+except ImportError:
+    # Run as a plain script (`python tools/uploader.py`)
+    import progress
+
+# boto3 and python-dotenv are imported inside the functions that use them so
+# that dry runs, `--help` and the other CLI subcommands never load the S3
+# client stack.
 
 class UploaderStats:
     def __init__(self):
@@ -38,7 +41,7 @@ class ProgressPercentage(object):
         self._size = float(os.path.getsize(filename))
         self._seen_so_far = 0
         self._lock = threading.Lock()
-        self._pbar = tqdm(
+        self._pbar = progress.bar(
             desc=os.path.basename(filename),
             total=self._size,
             unit='B',
@@ -56,28 +59,39 @@ class ProgressPercentage(object):
     def close(self):
         self._pbar.close()
 
-def setup_args():
-    parser = argparse.ArgumentParser(description="Upload content to R2")
+def add_arguments(parser):
     parser.add_argument("--source", default="./downloads", help="Source directory")
     parser.add_argument("--bucket", default="rssb-stream", help="R2 Bucket name")
     parser.add_argument("--dry-run", action="store_true", default=True, help="Dry run (default)")
     parser.add_argument("--no-dry-run", action="store_false", dest="dry_run", help="Execute real upload")
     parser.add_argument("--no-ssl-verify", action="store_true", help="Disable SSL verification (insecure, for testing)")
-    return parser.parse_args()
+    return parser
+
+def setup_args(argv=None):
+    parser = argparse.ArgumentParser(description="Upload content to R2")
+    return add_arguments(parser).parse_args(argv)
 
 def get_s3_client(verify_ssl=True):
+    from dotenv import find_dotenv, load_dotenv
+
+    # Load environment variables from the .env in (or above) the working
+    # directory; once installed, this file lives in site-packages.
+    load_dotenv(find_dotenv(usecwd=True))
+
     endpoint_url = os.getenv("R2_ENDPOINT_URL")
     access_key = os.getenv("R2_ACCESS_KEY_ID")
     secret_key = os.getenv("R2_SECRET_ACCESS_KEY")
 
     if not all([endpoint_url, access_key, secret_key]):
-        tqdm.write("Error: Missing R2 credentials. Please set R2_ENDPOINT_URL, R2_ACCESS_KEY_ID, and R2_SECRET_ACCESS_KEY.")
+        progress.write("Error: Missing R2 credentials. Please set R2_ENDPOINT_URL, R2_ACCESS_KEY_ID, and R2_SECRET_ACCESS_KEY.")
         return None
 
     if not verify_ssl:
         import urllib3
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+    import boto3
+
     return boto3.client(
         's3',
         endpoint_url=endpoint_url,
@@ -88,12 +102,14 @@ def get_s3_client(verify_ssl=True):
 
 def upload_file(s3, bucket, local_path, s3_key, dry_run):
     """Upload a file if it doesn't exist or size differs."""
+    from botocore.exceptions import ClientError
+
     stats.total += 1
 
     try:
         local_size = os.path.getsize(local_path)
     except OSError:
-        tqdm.write(f"  Error reading local file: {local_path}")
+        progress.write(f"  Error reading local file: {local_path}")
         stats.failed += 1
         return
 
@@ -106,17 +122,17 @@ def upload_file(s3, bucket, local_path, s3_key, dry_run):
             stats.skipped += 1
             return # Skip silently or maybe debug log
         else:
-            tqdm.write(f"  Update needed: {s3_key} (Local: {local_size}, Remote: {remote_size})")
+            progress.write(f"  Update needed: {s3_key} (Local: {local_size}, Remote: {remote_size})")
 
     except ClientError as e:
         # 404 Not Found means we need to upload
         if e.response['Error']['Code'] != "404":
-            tqdm.write(f"  Error checking {s3_key}: {e}")
+            progress.write(f"  Error checking {s3_key}: {e}")
             stats.failed += 1
             return
 
     if dry_run:
-        tqdm.write(f"  [Dry Run] Would upload: {local_path} -> s3://{bucket}/{s3_key}")
+        progress.write(f"  [Dry Run] Would upload: {local_path} -> s3://{bucket}/{s3_key}")
         stats.uploaded += 1 # Count as uploaded in dry run context
         return
 
@@ -126,26 +142,24 @@ def upload_file(s3, bucket, local_path, s3_key, dry_run):
         if content_type is None:
             content_type = 'application/octet-stream'
 
-        progress = ProgressPercentage(local_path)
+        callback = ProgressPercentage(local_path)
         with open(local_path, "rb") as f:
             s3.upload_fileobj(
                 f,
                 bucket,
                 s3_key,
-                Callback=progress,
+                Callback=callback,
                 ExtraArgs={'ContentType': content_type}
             )
-        progress.close()
+        callback.close()
         stats.uploaded += 1
     except Exception as e:
-        tqdm.write(f"  Failed to upload {local_path}: {e}")
+        progress.write(f"  Failed to upload {local_path}: {e}")
         stats.failed += 1
 
-def main():
-    args = setup_args()
-
+def run(args):
     if not os.path.exists(args.source):
-        tqdm.write(f"Source directory not found: {args.source}")
+        progress.write(f"Source directory not found: {args.source}")
         return
 
     s3 = None
@@ -154,7 +168,7 @@ def main():
         if not s3:
             return
     else:
-        tqdm.write("=== DRY RUN MODE ===")
+        progress.write("=== DRY RUN MODE ===")
 
     # Gather all files first to use tqdm for the main loop
     file_list = []
@@ -162,9 +176,9 @@ def main():
         for file in files:
             file_list.append(os.path.join(root, file))
 
-    tqdm.write(f"Found {len(file_list)} files to process.")
+    progress.write(f"Found {len(file_list)} files to process.")
 
-    for local_path in tqdm(file_list, desc="Processing Files", unit="file"):
+    for local_path in progress.bar(file_list, desc="Processing Files", unit="file"):
         # Compute S3 key (relative path)
         rel_path = os.path.relpath(local_path, args.source)
         # Ensure forward slashes for S3 keys regardless of OS
@@ -174,12 +188,15 @@ def main():
             upload_file(s3, args.bucket, local_path, s3_key, args.dry_run)
         else:
             # Dry run without credentials
-            tqdm.write(f"  [Dry Run] Would upload: {local_path} -> s3://{args.bucket}/{s3_key}")
+            progress.write(f"  [Dry Run] Would upload: {local_path} -> s3://{args.bucket}/{s3_key}")
             stats.total += 1
             stats.uploaded += 1
 
     print("\n=== Done! ===")
     print(stats)
 
+def main(argv=None):
+    return run(setup_args(argv))
+
 if __name__ == "__main__":
     main()